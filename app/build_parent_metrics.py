@@ -40,6 +40,17 @@ DATA_DIR = os.path.join(ROOT, "data")
 os.makedirs(DATA_DIR, exist_ok=True)
 
 METRICS_PARENT_FILE = os.path.join(DATA_DIR, "metrics_parent_reps.json")
+METRICS_PARENT_PARQUET = os.path.join(DATA_DIR, "metrics_parent_reps.parquet")
+
+# scalar metric fields flattened into the parquet sidecar (the nested
+# scheme_details_raw / scheme_quote_raw blobs stay JSON-only)
+PARQUET_METRIC_COLS = (
+    "scheme_code", "data_points", "first_date", "last_date",
+    "cagr", "rolling_1y", "rolling_3y", "rolling_5y",
+    "volatility_annual", "sharpe", "sortino", "max_drawdown",
+    "expense_ratio_percent", "exit_load_percent", "aum",
+    "beta", "tracking_error",
+)
 
 
 def load_parent_reps():
@@ -133,7 +144,8 @@ def build_parent_metrics(limit: int = None,
     return parent_metrics
 
 
-def save_parent_metrics(parent_metrics: dict, path: str = METRICS_PARENT_FILE):
+def save_parent_metrics(parent_metrics: dict, path: str = METRICS_PARENT_FILE,
+                        parquet_path: str = METRICS_PARENT_PARQUET):
     try:
         with open(path, "w", encoding="utf-8") as f:
             json.dump(parent_metrics, f, indent=2, ensure_ascii=False)
@@ -141,6 +153,28 @@ def save_parent_metrics(parent_metrics: dict, path: str = METRICS_PARENT_FILE):
     except Exception as e:
         print("[build_parent_metrics] Failed to save metrics file:", e)
 
+    # columnar sidecar: one flat row per parent for O(1) lookups and
+    # vectorized scans without parsing the full JSON
+    try:
+        import pandas as pd
+        rows = []
+        for pk, info in parent_metrics.items():
+            m = info.get("metrics") if isinstance(info.get("metrics"), dict) else {}
+            row = {
+                "parent_key": pk,
+                "rep_code": info.get("rep_code"),
+                "rep_name": info.get("rep_name"),
+                "rep_reason": info.get("rep_reason"),
+                "rep_reason_score": info.get("rep_reason_score"),
+            }
+            for col in PARQUET_METRIC_COLS:
+                row[col] = m.get(col)
+            rows.append(row)
+        pd.DataFrame(rows).to_parquet(parquet_path, index=False)
+        print(f"[build_parent_metrics] Saved parquet sidecar to: {parquet_path}")
+    except Exception as e:
+        print("[build_parent_metrics] Failed to save parquet sidecar:", e)
+
 
 def main():
     import argparse
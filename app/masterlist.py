@@ -10,13 +10,22 @@ Behavior:
 - Persist masterlist, per-code caches, and parent masterlist JSON.
 """
 
+import functools
 import json
 import os
+import re
+import sqlite3
+import threading
 import time
 import traceback
 from typing import Dict, Optional, Tuple, List
+
+try:
+    import orjson
+except ImportError:  # optional fast path; stdlib json still works
+    orjson = None
 from datetime import datetime, timedelta, timezone
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from collections import defaultdict
 
 import pandas as pd
@@ -25,17 +34,22 @@ from mftool import Mftool
 # -------- CONFIG & PATHS --------
 BASE_DIR = os.path.dirname(__file__)
 CACHE_DIR = os.path.join(BASE_DIR, "..", "data")
-MASTER_CACHE_FILE = os.path.join(CACHE_DIR, "masterlist.json")
-DETAILS_CACHE_FILE = os.path.join(CACHE_DIR, "details_cache.json")
-QUOTE_CACHE_FILE = os.path.join(CACHE_DIR, "quote_cache.json")
+MASTER_CACHE_FILE = os.path.join(CACHE_DIR, "masterlist.json")  # legacy read-fallback
+MASTER_CACHE_PARQUET = os.path.join(CACHE_DIR, "masterlist.parquet")
+MASTER_META_FILE = os.path.join(CACHE_DIR, "masterlist.meta.json")
+DETAILS_CACHE_FILE = os.path.join(CACHE_DIR, "details_cache.json")   # legacy import source
+QUOTE_CACHE_FILE = os.path.join(CACHE_DIR, "quote_cache.json")       # legacy import source
+SCHEME_CACHE_DB = os.path.join(CACHE_DIR, "scheme_cache.db")
 PARENT_MASTER_FILE = os.path.join(CACHE_DIR, "parent_masterlist.json")
 
 CACHE_TTL_SECONDS = 60 * 60 * 24  # 24 hours
 NAV_FRESH_DAYS = 30               # NAV freshness window (days)
 
 # Performance tuning
-MAX_WORKERS = 20
+MAX_WORKERS = 20          # baseline pool size
+MAX_WORKERS_CAP = 64      # adaptive upper bound (matches pooled session size)
 CHECKPOINT_EVERY = 200
+CHUNK_SIZE = 64           # codes per thread task
 
 # In-memory caches
 _masterlist_cache: Optional[Dict[str, str]] = None
@@ -53,12 +67,27 @@ def _load_json(path: str):
     if not os.path.exists(path):
         return {}
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            data = f.read()
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
     except Exception:
         return {}
 
 
+def _dump_json_bytes(obj, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when available, stdlib fallback)."""
+    if orjson is not None:
+        opts = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            opts |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=opts)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 def _safe_save_json(path: str, obj):
     """Write a shallow copy to avoid concurrent modification errors."""
     try:
@@ -67,8 +96,8 @@ def _safe_save_json(path: str, obj):
             safe = dict(obj)
         except Exception:
             safe = obj
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(safe, f, ensure_ascii=False, indent=2)
+        with open(path, "wb") as f:
+            f.write(_dump_json_bytes(safe))
     except Exception as e:
         print(f"[masterlist] failed to save {path}: {e}")
 
@@ -77,6 +106,15 @@ def _normalize(name: str) -> str:
     return " ".join(str(name).lower().strip().split()) if name else ""
 
 
+def _codes_signature(codes_map: Dict[str, str]) -> str:
+    """Stable digest of the full AMFI code->name map (cache invalidation key)."""
+    import hashlib
+    h = hashlib.blake2b(digest_size=16)
+    for code, name in sorted(codes_map.items()):
+        h.update(f"{code}\x00{name}\n".encode("utf-8", "replace"))
+    return h.hexdigest()
+
+
 def _parse_date(val):
     """
     Parse date string with pandas and return timezone-aware datetime (UTC) or None.
@@ -112,35 +150,149 @@ def _is_nav_recent(last_upd):
     return (datetime.now(UTC) - dt) <= timedelta(days=NAV_FRESH_DAYS)
 
 
+# single compiled alternation per predicate: one C-level scan instead of
+# one substring probe per keyword ("closed"/"open" subsume their longer forms)
+_RE_CLOSED_TYPE = re.compile(r"closed|close ended|close-end|maturity")
+_RE_OPEN_TYPE = re.compile(
+    r"open|etf|exchange traded|index|liquid|equity|debt|hybrid|interval|fund of funds"
+)
+
+
 def _is_closed_scheme(scheme_type: str) -> bool:
     if not scheme_type:
         return False
-    s = str(scheme_type).lower()
-    closed_keywords = [
-        "closed ended", "close ended", "close-end", "closed-end", "closed", "maturity"
-    ]
-    return any(k in s for k in closed_keywords)
+    return bool(_RE_CLOSED_TYPE.search(str(scheme_type).lower()))
 
 
 def _is_open_or_interval(scheme_type: str) -> bool:
     if not scheme_type:
         return False
-    st = str(scheme_type).lower()
-    good_keywords = [
-        "open",
-        "open ended",
-        "open-ended",
-        "etf",
-        "exchange traded",
-        "index",
-        "liquid",
-        "equity",
-        "debt",
-        "hybrid",
-        "interval",
-        "fund of funds",
-    ]
-    return any(k in st for k in good_keywords)
+    return bool(_RE_OPEN_TYPE.search(str(scheme_type).lower()))
+
+
+def _adaptive_workers(total_codes: int) -> int:
+    """
+    Size the thread pool to the workload: the per-code checks are almost
+    entirely network wait, so scale in-flight requests with the number of
+    codes, capped to what the pooled session can sustain.
+    """
+    if total_codes <= 0:
+        return MAX_WORKERS
+    return min(MAX_WORKERS_CAP, max(MAX_WORKERS, total_codes // 1000))
+
+
+class _SqliteCache(dict):
+    """
+    Persistent per-code cache: one sqlite row per scheme code instead of a
+    single JSON blob rewritten wholesale at every checkpoint. Behaves as a
+    plain dict in memory; __setitem__ marks keys dirty and flush() upserts
+    only those rows. Existing JSON caches are imported once on first open.
+    """
+
+    def __init__(self, table: str, db_path: str = SCHEME_CACHE_DB, legacy_json: Optional[str] = None):
+        super().__init__()
+        self._table = table
+        self._dirty = set()
+        self._lock = threading.Lock()
+        _ensure_data_dir()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table}(code TEXT PRIMARY KEY, payload BLOB)")
+        rows = self._conn.execute(f"SELECT code, payload FROM {table}").fetchall()
+        for code, payload in rows:
+            try:
+                super().__setitem__(code, orjson.loads(payload) if orjson is not None else json.loads(payload))
+            except Exception:
+                continue
+        if not rows and legacy_json and os.path.exists(legacy_json):
+            for k, v in (_load_json(legacy_json) or {}).items():
+                self[k] = v
+            self.flush()
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        with self._lock:
+            self._dirty.add(key)
+
+    def flush(self) -> None:
+        """Upsert dirty rows in one executemany batch (O(changed), not O(N))."""
+        with self._lock:
+            dirty = list(self._dirty)
+            self._dirty.clear()
+        if not dirty:
+            return
+        batch = []
+        for k in dirty:
+            v = self.get(k)
+            payload = orjson.dumps(v) if orjson is not None else json.dumps(v, ensure_ascii=False).encode("utf-8")
+            batch.append((str(k), payload))
+        with self._lock:
+            self._conn.executemany(f"INSERT OR REPLACE INTO {self._table} VALUES(?,?)", batch)
+            self._conn.commit()
+
+
+@functools.lru_cache(maxsize=None)
+def _scheme_cache(table: str) -> _SqliteCache:
+    legacy = DETAILS_CACHE_FILE if table == "details" else QUOTE_CACHE_FILE
+    return _SqliteCache(table, legacy_json=legacy)
+
+
+class _AdaptiveThrottle:
+    """
+    Crude failure-aware backoff shared by the worker threads: consecutive
+    upstream errors progressively slow new requests (effectively shrinking
+    concurrency) instead of hammering a struggling endpoint; any success
+    resets the delay.
+    """
+
+    def __init__(self, threshold: int = 10, step: float = 0.05, max_delay: float = 2.0):
+        self._lock = threading.Lock()
+        self._consecutive = 0
+        self._threshold = threshold
+        self._step = step
+        self._max_delay = max_delay
+
+    def record(self, ok: bool) -> None:
+        with self._lock:
+            self._consecutive = 0 if ok else self._consecutive + 1
+
+    def wait(self) -> None:
+        with self._lock:
+            over = self._consecutive - self._threshold
+        if over > 0:
+            time.sleep(min(self._max_delay, over * self._step))
+
+
+_throttle = _AdaptiveThrottle()
+
+
+@functools.lru_cache(maxsize=1)
+def _mf() -> Mftool:
+    """
+    Shared Mftool instance: construction is expensive (it fetches the scheme
+    code list) and a single instance lets the pooled session actually reuse
+    connections across callers.
+    """
+    return _mount_pooled_adapters(Mftool())
+
+
+def _mount_pooled_adapters(mf: Mftool, pool_connections: int = 32, pool_maxsize: int = 64) -> Mftool:
+    """
+    Enlarge the connection pool on mftool's internal requests.Session so the
+    threaded build reuses keep-alive connections instead of paying TCP+TLS
+    setup per call. No-op if the mftool version has no _session attribute.
+    """
+    try:
+        import requests.adapters
+        session = getattr(mf, "_session", None)
+        if session is not None:
+            adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+    except Exception:
+        pass
+    return mf
 
 
 # ---------- per-code checker (thread worker) ----------
@@ -156,10 +308,13 @@ def _check_code_active(mf: Mftool, code: str, details_cache: Dict, quote_cache:
 
     # fetch details if missing
     if details is None:
+        _throttle.wait()
         try:
             details = mf.get_scheme_details(code) or {}
+            _throttle.record(ok=bool(details))
         except Exception:
             details = {}
+            _throttle.record(ok=False)
         details_cache[code] = details
 
     scheme_type = details.get("scheme_type") or details.get("type") or details.get("status") or ""
@@ -170,10 +325,13 @@ def _check_code_active(mf: Mftool, code: str, details_cache: Dict, quote_cache:
 
     # fetch quote if missing
     if quote is None:
+        _throttle.wait()
         try:
             quote = mf.get_scheme_quote(code) or {}
+            _throttle.record(ok=bool(quote))
         except Exception:
             quote = {}
+            _throttle.record(ok=False)
         quote_cache[code] = quote
 
     nav = quote.get("nav") or quote.get("nav_val") or quote.get("nav_value") or details.get("nav")
@@ -196,7 +354,7 @@ def _check_code_active(mf: Mftool, code: str, details_cache: Dict, quote_cache:
 
 
 # ------------------ Masterlist build (parallel + caches) ------------------
-def build_master_list_cache(force: bool = False, max_workers: int = MAX_WORKERS) -> Dict[str, str]:
+def build_master_list_cache(force: bool = False, max_workers: Optional[int] = None) -> Dict[str, str]:
     """
     Build masterlist mapping normalized_name -> code for active (investable) schemes.
     Uses parallel per-code checking and persistent per-code caches.
@@ -207,24 +365,38 @@ def build_master_list_cache(force: bool = False, max_workers: int = MAX_WORKERS)
     if _masterlist_cache is not None and not force:
         return _masterlist_cache
 
-    # try disk masterlist
+    # try disk masterlist (parquet preferred; freshness from file mtime)
+    if os.path.exists(MASTER_CACHE_PARQUET) and not force:
+        try:
+            if (time.time() - os.path.getmtime(MASTER_CACHE_PARQUET)) <= CACHE_TTL_SECONDS:
+                df = pd.read_parquet(MASTER_CACHE_PARQUET)
+                loaded = dict(zip(df["norm"], df["code"]))
+                if loaded:  # never serve an empty persisted build for a full TTL
+                    _masterlist_cache = loaded
+                    print(f"[masterlist] loaded masterlist from parquet ({len(_masterlist_cache)} entries)")
+                    return _masterlist_cache
+        except Exception:
+            pass
+
+    # legacy JSON masterlist read-fallback
     if os.path.exists(MASTER_CACHE_FILE) and not force:
         try:
-            with open(MASTER_CACHE_FILE, "r", encoding="utf-8") as f:
-                payload = json.load(f)
+            payload = _load_json(MASTER_CACHE_FILE)
             ts = payload.get("meta", {}).get("ts", 0)
             if (time.time() - ts) <= CACHE_TTL_SECONDS:
-                _masterlist_cache = payload.get("master", {})
-                print(f"[masterlist] loaded masterlist from disk ({len(_masterlist_cache)} entries)")
-                return _masterlist_cache
+                loaded = payload.get("master", {})
+                if loaded:
+                    _masterlist_cache = loaded
+                    print(f"[masterlist] loaded masterlist from disk ({len(_masterlist_cache)} entries)")
+                    return _masterlist_cache
         except Exception:
             pass
 
-    # load per-code caches
-    details_cache = _load_json(DETAILS_CACHE_FILE)
-    quote_cache = _load_json(QUOTE_CACHE_FILE)
+    # load per-code caches (sqlite-backed; legacy JSON imported on first open)
+    details_cache = _scheme_cache("details")
+    quote_cache = _scheme_cache("quote")
 
-    mf = Mftool()
+    mf = _mf()
     try:
         codes_map = mf.get_scheme_codes() or {}
     except Exception as e:
@@ -234,37 +406,69 @@ def build_master_list_cache(force: bool = False, max_workers: int = MAX_WORKERS)
             return _masterlist_cache
         return {}
 
+    _masterlist_meta["codes_map"] = codes_map
+    _masterlist_meta["codes_map_ts"] = time.time()
+
+    # signature check: if the AMFI code list is unchanged since the last build,
+    # the stale-TTL cache is still valid — skip the per-code revalidation pass.
+    sig = _codes_signature(codes_map)
+    if not force and os.path.exists(MASTER_CACHE_PARQUET):
+        try:
+            meta = _load_json(MASTER_META_FILE)
+            if meta.get("sig") == sig:
+                df = pd.read_parquet(MASTER_CACHE_PARQUET)
+                loaded = dict(zip(df["norm"], df["code"]))
+                if loaded:
+                    _masterlist_cache = loaded
+                    _masterlist_meta["ts"] = time.time()
+                    _safe_save_json(MASTER_META_FILE, {"ts": time.time(), "sig": sig})
+                    print(f"[masterlist] scheme-code signature unchanged; reusing cached masterlist ({len(_masterlist_cache)} entries)")
+                    return _masterlist_cache
+        except Exception:
+            pass
+
     total = len(codes_map)
-    print(f"[masterlist] total schemes from mftool: {total}")
+    workers = max_workers or _adaptive_workers(total)
+    print(f"[masterlist] total schemes from mftool: {total} (workers={workers})")
 
-    master: Dict[str, str] = {}
+    active_pairs: List[Tuple[str, str]] = []
     skipped_samples = []
     processed = 0
     active_count = 0
 
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = {ex.submit(_check_code_active, mf, code, details_cache, quote_cache): (code, name) for code, name in codes_map.items()}
-
-        for fut in as_completed(futures):
-            code, name = futures[fut]
+    def _check_chunk(chunk: List[Tuple[str, str]]) -> List[Tuple[str, str, bool]]:
+        """Check a chunk of (code, name) pairs in one task (fewer Future objects)."""
+        results = []
+        for code, name in chunk:
             try:
-                code_ret, details, quote, is_active = fut.result()
+                _, _details, _quote, is_active = _check_code_active(mf, code, details_cache, quote_cache)
             except Exception:
-                code_ret, details, quote, is_active = code, {}, {}, False
-
-            processed += 1
-
-            if is_active:
-                master[_normalize(name)] = str(code)
-                active_count += 1
-            else:
-                if len(skipped_samples) < 10:
+                is_active = False
+            results.append((code, name, is_active))
+        return results
+
+    items = list(codes_map.items())
+    chunks = [items[i:i + CHUNK_SIZE] for i in range(0, len(items), CHUNK_SIZE)]
+    last_checkpoint = 0
+
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for chunk_results in ex.map(_check_chunk, chunks):
+            for code, name, is_active in chunk_results:
+                processed += 1
+                if is_active:
+                    active_pairs.append((_normalize(name), str(code)))
+                    active_count += 1
+                elif len(skipped_samples) < 10:
                     skipped_samples.append((code, name))
 
-            if processed % CHECKPOINT_EVERY == 0:
+            if processed - last_checkpoint >= CHECKPOINT_EVERY:
+                last_checkpoint = processed
                 print(f"[masterlist] processed {processed}/{total}, active={active_count}; checkpointing caches...")
-                _safe_save_json(DETAILS_CACHE_FILE, details_cache)
-                _safe_save_json(QUOTE_CACHE_FILE, quote_cache)
+                details_cache.flush()
+                quote_cache.flush()
+
+    # one C-level dict build instead of per-future inserts
+    master: Dict[str, str] = dict(active_pairs)
 
     print(f"[masterlist] done processing. active_count={active_count}")
     if skipped_samples:
@@ -272,23 +476,45 @@ def build_master_list_cache(force: bool = False, max_workers: int = MAX_WORKERS)
         for code, name in skipped_samples:
             print(" -", code, "-", name)
 
-    # save masterlist & caches
-    payload = {"meta": {"ts": time.time()}, "master": master}
+    # save masterlist & caches (columnar parquet: faster to parse than
+    # pretty-printed JSON at startup; masterlist.json is kept as read-fallback)
     try:
         _ensure_data_dir()
-        with open(MASTER_CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        pd.DataFrame({"norm": list(master.keys()), "code": list(master.values())}).to_parquet(MASTER_CACHE_PARQUET)
+        _safe_save_json(MASTER_META_FILE, {"ts": time.time(), "sig": sig})
     except Exception as e:
         print("[masterlist] failed to save masterlist:", e)
 
-    _safe_save_json(DETAILS_CACHE_FILE, details_cache)
-    _safe_save_json(QUOTE_CACHE_FILE, quote_cache)
+    details_cache.flush()
+    quote_cache.flush()
 
     _masterlist_cache = master
     _masterlist_meta["ts"] = time.time()
     return master
 
 
+def get_codes_map_cached(mf: Optional[Mftool] = None, max_age_seconds: float = CACHE_TTL_SECONDS) -> Dict[str, str]:
+    """
+    Return the raw AMFI code->name map, reusing the copy fetched by
+    build_master_list_cache when it is still fresh (avoids a second full
+    HTTP fetch + parse of the entire scheme list per rebuild).
+    """
+    codes_map = _masterlist_meta.get("codes_map")
+    ts = _masterlist_meta.get("codes_map_ts", 0.0)
+    if codes_map and (time.time() - ts) <= max_age_seconds:
+        return codes_map
+
+    if mf is None:
+        mf = _mf()
+    try:
+        codes_map = mf.get_scheme_codes() or {}
+    except Exception:
+        return codes_map or {}
+    _masterlist_meta["codes_map"] = codes_map
+    _masterlist_meta["codes_map_ts"] = time.time()
+    return codes_map
+
+
 def refresh_masterlist():
     return build_master_list_cache(force=True)
 
@@ -296,6 +522,41 @@ def refresh_masterlist():
 # ============== Parent grouping (exact normalized-name grouping) ==============
 
 # ------------- Normalization utilities (strip plan/option tokens) -------------
+# Patterns compiled once at module scope: these run 8+ times per scheme name
+# across tens of thousands of codes in group_variants_exact.
+_RE_BULLETS = re.compile(r"[\/|••]+")
+_RE_IDCW_LONG = re.compile(
+    r"\b(payout of income distribution cum capital withdrawal|payout of income distribution|income distribution cum capital withdrawal|payout of income distribution cum capital withdrawal \(idcw\))\b",
+    re.IGNORECASE,
+)
+_RE_BRACKETS = re.compile(r"[\(\[\{][^\)\]\}]*[\)\]\}]")
+_RE_TOKENS = re.compile(
+    r"\b(?:direct plan|regular plan|direct|regular|plan|option|growth|idcw|dividend|div|dividend reinvestment|reinvestment|monthly|quarterly|annual|institutional|inst|super institutional|sub-plan|sub plan|retail|monthly idcw|fortnightly idcw|weekly idcw|payout|bonus)\b",
+    re.IGNORECASE,
+)
+# Fused removal pass: IDCW phrases, bracketed qualifiers and plan/option
+# tokens all replace with " ", so they can be a single alternation scanned
+# once per name (longest/most-specific alternatives first). The [,;:]+ pass
+# must stay separate: it runs after trimming, which preserves trailing
+# hyphens in a handful of existing parent keys.
+_RE_STRIP = re.compile(
+    r"|".join(
+        (
+            _RE_IDCW_LONG.pattern,
+            _RE_BRACKETS.pattern,
+            _RE_TOKENS.pattern,
+        )
+    ),
+    re.IGNORECASE,
+)
+_RE_MULTIHYPHEN = re.compile(r"[-]{2,}")
+_RE_HYPHEN_SPACES = re.compile(r"\s*-\s*")
+_RE_WS = re.compile(r"\s{2,}")
+_RE_TRIM = re.compile(r"(^[\s\-\:]+|[\s\-\:]+$)")
+_RE_PUNCT = re.compile(r"[,;:]+")
+_RE_PUNCT2 = re.compile(r"[\.\'\"\/\(\)\[\]\:]+")
+
+
 def _strip_plan_option_tokens(name: str) -> str:
     """
     Heuristics to remove plan/option tokens from scheme names while preserving
@@ -307,43 +568,45 @@ def _strip_plan_option_tokens(name: str) -> str:
     s = str(name)
 
     # Normalize some unicode bullets/separators into hyphen
-    s = __import__("re").sub(r"[\/|•\u2022]+", "-", s)
-
-    # Remove large, verbose IDCW/payout phrases (common long-form)
-    s = __import__("re").sub(
-        r"\b(payout of income distribution cum capital withdrawal|payout of income distribution|income distribution cum capital withdrawal|payout of income distribution cum capital withdrawal \(idcw\))\b",
-        " ",
-        s,
-        flags=__import__("re").IGNORECASE,
-    )
+    s = _RE_BULLETS.sub("-", s)
 
-    # Remove bracketed qualifiers e.g. (Direct Plan), (IDCW), [Direct]
-    s = __import__("re").sub(r"[\(\[\{][^\)\]\}]*[\)\]\}]", " ", s)
-
-    # Remove explicit 'Plan'/'Option' connected tokens and short descriptors
-    tokens_pattern = r"\b(?:direct plan|regular plan|direct|regular|plan|option|growth|idcw|dividend|div|dividend reinvestment|reinvestment|monthly|quarterly|annual|institutional|inst|super institutional|sub-plan|sub plan|retail|monthly idcw|fortnightly idcw|weekly idcw|payout|bonus)\b"
-    s = __import__("re").sub(tokens_pattern, " ", s, flags=__import__("re").IGNORECASE)
+    # Remove IDCW/payout phrases, bracketed qualifiers and plan/option
+    # tokens in one scan
+    s = _RE_STRIP.sub(" ", s)
 
     # clean hyphens / whitespace / punctuation
-    s = __import__("re").sub(r"[-]{2,}", "-", s)
-    s = __import__("re").sub(r"\s*-\s*", " - ", s)
-    s = __import__("re").sub(r"\s{2,}", " ", s)
-    s = __import__("re").sub(r"(^[\s\-\:]+|[\s\-\:]+$)", "", s)
-    s = __import__("re").sub(r"[,;:]+", " ", s)
+    s = _RE_MULTIHYPHEN.sub("-", s)
+    s = _RE_HYPHEN_SPACES.sub(" - ", s)
+    s = _RE_WS.sub(" ", s)
+    s = _RE_TRIM.sub("", s)
+    s = _RE_PUNCT.sub(" ", s)
 
     return s.strip()
 
 
+@functools.lru_cache(maxsize=65536)
 def normalize_parent_name(name: str) -> str:
     """
     Normalize the stripped parent name for grouping (lowercase, collapse spaces).
+    Memoized: plan variants of the same product repeat the expensive regex
+    passes on near-identical inputs, and rebuilds re-normalize the same ~40k
+    names every run.
     """
     base = _strip_plan_option_tokens(name)
-    base = __import__("re").sub(r"[\.\'\"\/\(\)\[\]\:]+", " ", base)
+    base = _RE_PUNCT2.sub(" ", base)
     base = " ".join(base.split())
     return base.lower().strip()
 
 
+def normalize_parent_names(names: List[str]) -> List[str]:
+    """
+    Batch variant of normalize_parent_name: normalize each distinct name once
+    and fan the result back out, instead of paying the regex passes per item.
+    """
+    distinct = {n: normalize_parent_name(n) for n in set(names)}
+    return [distinct[n] for n in names]
+
+
 # ------------- Group plan-level variants into parent products (exact match on normalized name) -------------
 def group_variants_exact(code_to_name: Dict[str, str]) -> Dict[str, List[Tuple[str, str]]]:
     """
@@ -352,8 +615,9 @@ def group_variants_exact(code_to_name: Dict[str, str]) -> Dict[str, List[Tuple[s
     Output: parent_norm -> [(code, original_name), ...]
     """
     groups = defaultdict(list)
-    for code, name in code_to_name.items():
-        parent_norm = normalize_parent_name(name)
+    items = list(code_to_name.items())
+    norms = normalize_parent_names([name for _, name in items])
+    for (code, name), parent_norm in zip(items, norms):
         if not parent_norm:
             parent_norm = str(name).lower().strip()
         groups[parent_norm].append((str(code), name))
@@ -361,6 +625,12 @@ def group_variants_exact(code_to_name: Dict[str, str]) -> Dict[str, List[Tuple[s
 
 
 # ------------- Representative selection -------------
+# One compiled pattern per plan/option token; each entry name is scanned once
+# for all tokens instead of once per (priority pass, token) pair.
+_REP_TOKEN_RE = {t: re.compile(rf"\b{t}\b", re.IGNORECASE)
+                 for t in ("direct", "regular", "growth", "idcw", "dividend")}
+
+
 def choose_representative(entries: List[Tuple[str, str]],
                           mf: Optional[Mftool] = None,
                           quote_cache: Optional[Dict[str, dict]] = None) -> Tuple[Optional[str], Optional[str], str, float]:
@@ -379,22 +649,23 @@ def choose_representative(entries: List[Tuple[str, str]],
     if not entries:
         return None, None, "empty", 0.0
 
-    def has_token(name: str, token: str) -> bool:
-        return bool(__import__("re").search(rf"\b{__import__('re').escape(token)}\b", name, flags=__import__("re").IGNORECASE))
+    # tokenize every entry name once; priority passes become dict lookups
+    tagged = [(code, name, {t: bool(rx.search(name)) for t, rx in _REP_TOKEN_RE.items()})
+              for code, name in entries]
 
     # 1) direct + growth
-    for code, name in entries:
-        if has_token(name, "direct") and (has_token(name, "growth") or (not has_token(name, "idcw") and not has_token(name, "dividend"))):
+    for code, name, flags in tagged:
+        if flags["direct"] and (flags["growth"] or (not flags["idcw"] and not flags["dividend"])):
             return code, name, "direct_growth", 100.0
 
     # 2) direct any
-    for code, name in entries:
-        if has_token(name, "direct"):
+    for code, name, flags in tagged:
+        if flags["direct"]:
             return code, name, "direct", 80.0
 
     # 3) regular + growth
-    for code, name in entries:
-        if has_token(name, "regular") and has_token(name, "growth"):
+    for code, name, flags in tagged:
+        if flags["regular"] and flags["growth"]:
             return code, name, "regular_growth", 60.0
 
     # 4) pick highest AUM if available (cached then live)
@@ -417,7 +688,7 @@ def choose_representative(entries: List[Tuple[str, str]],
 
     if mf is None:
         try:
-            mf = Mftool()
+            mf = _mf()
         except Exception:
             mf = None
 
@@ -459,29 +730,39 @@ def build_parent_masterlist_from_codes_exact(code_to_name: Dict[str, str],
 
     # prepare quote cache
     quote_cache = {}
-    if quote_cache_path and os.path.exists(quote_cache_path):
+    if quote_cache_path:
         try:
-            quote_cache = _load_json(quote_cache_path)
+            if quote_cache_path == QUOTE_CACHE_FILE:
+                quote_cache = _scheme_cache("quote")
+            elif os.path.exists(quote_cache_path):
+                quote_cache = _load_json(quote_cache_path)
         except Exception:
             quote_cache = {}
 
     if mf is None:
         try:
-            mf = Mftool()
+            mf = _mf()
         except Exception:
             mf = None
 
-    parent_reps = {}
-    for parent, entries in parent_groups.items():
-        rep_code, rep_name, reason, score = choose_representative(entries, mf=mf, quote_cache=quote_cache)
-        parent_reps[parent] = (rep_code, rep_name, reason, score)
+    # per-parent selection is independent; run it across threads so the
+    # highest_aum_live branch (blocking quote fetches) overlaps with the
+    # CPU-bound tokenization of other parents. quote_cache is only read here.
+    def _pick(item):
+        parent, entries = item
+        return parent, choose_representative(entries, mf=mf, quote_cache=quote_cache)
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        parent_reps = dict(ex.map(_pick, parent_groups.items()))
 
     # Persist parent masterlist
     try:
         _ensure_data_dir()
         payload = {"meta": {"ts": time.time()}, "parent_groups": parent_groups, "parent_reps": parent_reps}
-        with open(PARENT_MASTER_FILE, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        # compact write: the file is only consumed by code, indentation just
+        # inflates encode time and size
+        with open(PARENT_MASTER_FILE, "wb") as f:
+            f.write(_dump_json_bytes(payload, indent=False))
         print(f"[parent_mapper] saved parent masterlist to {PARENT_MASTER_FILE}")
     except Exception as e:
         print("[parent_mapper] failed to save parent masterlist:", e)
@@ -490,18 +771,15 @@ def build_parent_masterlist_from_codes_exact(code_to_name: Dict[str, str],
 
 
 # ============== Helper to build end-to-end ==============
-def build_all_exact(force_master: bool = False, max_workers: int = MAX_WORKERS):
+def build_all_exact(force_master: bool = False, max_workers: Optional[int] = None):
     """
     Build masterlist and then parent masterlist (exact normalized grouping).
     Returns (masterlist_map, code_to_name_map, parent_groups, parent_reps)
     """
     master = build_master_list_cache(force=force_master, max_workers=max_workers)
 
-    mf = Mftool()
-    try:
-        codes_map = mf.get_scheme_codes() or {}
-    except Exception:
-        codes_map = {}
+    mf = _mf()
+    codes_map = get_codes_map_cached(mf=mf)
 
     # filter codes_map to only codes present in masterlist values
     active_codes = set(master.values())
@@ -517,7 +795,7 @@ def build_all_exact(force_master: bool = False, max_workers: int = MAX_WORKERS):
 if __name__ == "__main__":
     print("Rebuilding masterlist (active schemes) and parent masterlist (exact grouping)...")
     t0 = time.time()
-    master, code_to_name, parent_groups, parent_reps = build_all_exact(force_master=True, max_workers=MAX_WORKERS)
+    master, code_to_name, parent_groups, parent_reps = build_all_exact(force_master=True)
     t1 = time.time()
     print(f"Done. Active masterlist entries: {len(master)}")
     print(f"Code->Name map entries used: {len(code_to_name)}")
@@ -5,13 +5,16 @@ Does NOT import any private helpers from masterlist.py.
 
 Provides:
 - match_name_to_code(name, threshold=75, limit=5) -> List[(scheme_name, code, score)]
+- match_names_batch(names, threshold=75, limit=5) -> List[List[(scheme_name, code, score)]]
 - best_match(name, threshold=75) -> (scheme_name, code, score) or (None, None, 0.0)
+- refresh_matcher_cache() -> drop the cached choices after a masterlist rebuild
 """
 
+import functools
 from typing import List, Tuple, Optional, Dict
+import numpy as np
 from rapidfuzz import fuzz, process
-from mftool import Mftool
-from .masterlist import build_master_list_cache
+from .masterlist import build_master_list_cache, get_codes_map_cached
 
 # Local normalizer (do not rely on master's private helpers)
 def _normalize_query(q: str) -> str:
@@ -30,20 +33,46 @@ def _build_choices_and_map() -> Tuple[List[str], Dict[str, str], Dict[str, str]]
     choices = list(master.keys())  # these are normalized names
     norm_to_code = dict(master)    # normalized_name -> code
 
-    # get original names from mftool (code -> original name)
+    # get original names (code -> original name) from the masterlist module's
+    # cached codes map; avoids a fresh mftool fetch + 40k-item rebuild per call
     code_to_orig = {}
     try:
-        mf = Mftool()
-        codes_map = mf.get_scheme_codes() or {}
+        codes_map = get_codes_map_cached() or {}
         # codes_map: {code: original_name}
         for code, orig in codes_map.items():
             code_to_orig[str(code)] = orig
     except Exception:
-        # If mftool fails, we will fallback to using normalized names as display names
+        # If the fetch fails, we will fallback to using normalized names as display names
         code_to_orig = {}
 
     return choices, norm_to_code, code_to_orig
 
+@functools.lru_cache(maxsize=1)
+def _cached_choices() -> Tuple[Tuple[str, ...], Dict[str, str], Dict[str, str]]:
+    """
+    Memoized _build_choices_and_map: building it re-loads the masterlist and
+    re-fetches mftool codes, which is pure waste when answering many queries.
+    """
+    choices, norm_to_code, code_to_orig = _build_choices_and_map()
+    return tuple(choices), norm_to_code, code_to_orig
+
+def refresh_matcher_cache() -> None:
+    """Invalidate cached choices (call after a masterlist rebuild)."""
+    _cached_choices.cache_clear()
+
+def _resolve_matches(results, norm_to_code: Dict[str, str], code_to_orig: Dict[str, str], threshold: int) -> List[Tuple[str, str, float]]:
+    out: List[Tuple[str, str, float]] = []
+    for choice, score, _index in results:
+        if score < threshold:
+            continue
+        code = norm_to_code.get(choice)
+        if not code:
+            continue
+        # map code -> original name for display where possible
+        orig_name = code_to_orig.get(str(code)) or choice
+        out.append((orig_name, str(code), float(score)))
+    return out
+
 def match_name_to_code(name: str, threshold: int = 75, limit: int = 5) -> List[Tuple[str, str, float]]:
     """
     Return up to `limit` matches as tuples: (scheme_name_display, scheme_code, score)
@@ -54,23 +83,39 @@ def match_name_to_code(name: str, threshold: int = 75, limit: int = 5) -> List[T
         return []
 
     query = _normalize_query(name)
-    choices, norm_to_code, code_to_orig = _build_choices_and_map()
+    choices, norm_to_code, code_to_orig = _cached_choices()
     if not choices:
         return []
 
     # Rapidfuzz: returns tuples (choice, score, idx)
     results = process.extract(query, choices, scorer=fuzz.token_set_ratio, limit=limit)
+    return _resolve_matches(results, norm_to_code, code_to_orig, threshold)
 
-    out: List[Tuple[str, str, float]] = []
-    for choice, score, _index in results:
-        if score < threshold:
-            continue
-        code = norm_to_code.get(choice)
-        if not code:
-            continue
-        # map code -> original name for display where possible
-        orig_name = code_to_orig.get(str(code)) or choice
-        out.append((orig_name, str(code), float(score)))
+def match_names_batch(names: List[str], threshold: int = 75, limit: int = 5) -> List[List[Tuple[str, str, float]]]:
+    """
+    Batch variant of match_name_to_code: scores all queries against all choices
+    in one rapidfuzz.process.cdist call (C-level, multi-threaded, GIL-released)
+    instead of a Python loop of per-query extracts.
+    Returns one result list per input name, aligned with `names`.
+    """
+    if not names:
+        return []
+
+    choices, norm_to_code, code_to_orig = _cached_choices()
+    k = min(limit, len(choices))
+    if k < 1:
+        return [[] for _ in names]
+
+    queries = [_normalize_query(n) for n in names]
+    scores = process.cdist(queries, choices, scorer=fuzz.token_set_ratio, workers=-1)
+
+    out: List[List[Tuple[str, str, float]]] = []
+    for row in scores:
+        # top-k indices without a full sort, then order those by score desc
+        top = np.argpartition(row, -k)[-k:]
+        top = top[np.argsort(row[top])[::-1]]
+        results = [(choices[i], float(row[i]), int(i)) for i in top]
+        out.append(_resolve_matches(results, norm_to_code, code_to_orig, threshold))
     return out
 
 def best_match(name: str, threshold: int = 75) -> Tuple[Optional[str], Optional[str], float]:
@@ -12,6 +12,7 @@ Designed to be used on representative child codes (one per parent scheme).
 Benchmark-based metrics (beta, tracking error) are LEFT as placeholders for now.
 """
 
+import functools
 import os
 import logging
 import time
@@ -33,6 +34,12 @@ os.makedirs(NAV_CACHE_DIR, exist_ok=True)
 
 CACHE_MAX_AGE_DAYS = 7
 
+
+@functools.lru_cache(maxsize=1)
+def _mf() -> Mftool:
+    """Shared Mftool instance (construction fetches the full scheme list)."""
+    return Mftool()
+
 # ---------------------------
 # Logging setup for this module
 # ---------------------------
@@ -103,29 +110,30 @@ def _nav_from_dict(data: dict) -> pd.Series:
     if not isinstance(data, dict):
         return pd.Series(dtype=float)
     rows = data.get("data") or []
-    out = []
-    for r in rows:
-        try:
-            d = pd.to_datetime(r.get("date"), format="%d-%m-%Y", errors="coerce")
-            v = float(str(r.get("nav")).replace(",", ""))
-            if pd.notna(d):
-                out.append((d, v))
-        except Exception:
-            continue
-    if not out:
+    if not rows:
         return pd.Series(dtype=float)
-    df = pd.DataFrame(out, columns=["date", "nav"]).set_index("date")
-    s = df["nav"]
+    # single vectorized parse instead of per-row to_datetime/float calls
+    dates = [r.get("date") for r in rows]
+    navs = [str(r.get("nav") or "").replace(",", "") for r in rows]
+    idx = pd.to_datetime(dates, format="%d-%m-%Y", errors="coerce")
+    vals = pd.to_numeric(pd.Series(navs), errors="coerce")
+    s = pd.Series(vals.values, index=idx)
+    s = s[~s.index.isna()].dropna()
     return s.sort_index()
 
 
 # =====================================================
 # NAV FETCH via mftool + cache
 # =====================================================
+@functools.lru_cache(maxsize=4096)
 def fetch_nav_series(code: str) -> pd.Series:
     """
     Fetch NAV series for a scheme code.
 
+    Memoized per code: within one analysis run the same scheme is requested
+    repeatedly (metrics, comparisons, charts) and even the parquet-cache hit
+    costs a decode. Call invalidate_nav_cache() after a NAV refresh.
+
     1) Try local cache (nav_cache/{code}.parquet) if fresh.
     2) Else call:
          a) mf.get_scheme_historical_nav(code, as_Dataframe=True)  # preferred
@@ -160,7 +168,7 @@ def fetch_nav_series(code: str) -> pd.Series:
             _log(f"Cache read failed for {code}: {e}")
 
     # 2️⃣ Fetch from mftool
-    mf = Mftool()
+    mf = _mf()
 
     nav_series = pd.Series(dtype=float)
 
@@ -198,6 +206,11 @@ def fetch_nav_series(code: str) -> pd.Series:
     return nav_series
 
 
+def invalidate_nav_cache() -> None:
+    """Drop memoized NAV series (e.g. after the nightly refresh)."""
+    fetch_nav_series.cache_clear()
+
+
 # =====================================================
 # NAV -> RETURNS
 # =====================================================
@@ -237,6 +250,42 @@ def rolling_return(nav: pd.Series, window_days: int) -> Optional[float]:
     return compute_periodic_returns(window_nav)
 
 
+_NS_PER_DAY = 86_400 * 10**9
+
+
+def compute_all_periodic_returns(nav: pd.Series, windows=(365, 365 * 3, 365 * 5)) -> Dict[int, Optional[float]]:
+    """
+    Annualized return for several trailing windows in one pass.
+
+    Equivalent to calling rolling_return once per window, but the NAV values
+    and timestamps are pulled into numpy arrays once and each window start is
+    located with np.searchsorted instead of re-slicing the Series.
+    """
+    out: Dict[int, Optional[float]] = {w: None for w in windows}
+    if nav is None or len(nav) < 2:
+        return out
+
+    arr = np.asarray(nav.values, dtype=np.float64)
+    ts = nav.index.values.astype("datetime64[ns]").view("i8")
+    end_ts = ts[-1]
+    end_val = arr[-1]
+
+    for w in windows:
+        i = int(np.searchsorted(ts, end_ts - w * _NS_PER_DAY))
+        if len(arr) - i < 2:
+            continue
+        start_val = arr[i]
+        days = (end_ts - ts[i]) / _NS_PER_DAY
+        if start_val <= 0 or days <= 0:
+            continue
+        years = days / 365.0
+        try:
+            out[w] = float((end_val / start_val) ** (1.0 / years) - 1.0)
+        except Exception:
+            continue
+    return out
+
+
 # =====================================================
 # Risk metrics
 # =====================================================
@@ -328,7 +377,7 @@ def fetch_scheme_fees_and_aum(code: str):
         - aum
     from mftool get_scheme_details / get_scheme_quote.
     """
-    mf = Mftool()
+    mf = _mf()
     details = {}
     quote = {}
 
@@ -443,9 +492,10 @@ def compute_metrics_for_code(
 
     # Performance
     out["cagr"] = compute_periodic_returns(nav)
-    out["rolling_1y"] = rolling_return(nav, 365)
-    out["rolling_3y"] = rolling_return(nav, 365 * 3)
-    out["rolling_5y"] = rolling_return(nav, 365 * 5)
+    rolling = compute_all_periodic_returns(nav)
+    out["rolling_1y"] = rolling[365]
+    out["rolling_3y"] = rolling[365 * 3]
+    out["rolling_5y"] = rolling[365 * 5]
 
     # Risk
     out["volatility_annual"] = annualized_volatility(returns)
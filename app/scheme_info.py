@@ -13,14 +13,32 @@ Run:
     python -m app.scheme_info
 """
 import os
+import sys
 import json
 import re
-from typing import Any, Dict, List, Optional
+import mmap
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from rapidfuzz import fuzz, process
+
+try:
+    import orjson  # 3-6x faster parse than stdlib json on these files
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import ijson  # streaming parser for keys-only reads of the masterlist
+except ImportError:  # pragma: no cover - optional speedup
+    ijson = None
 
 BASE_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 PARENT_MASTERLIST_PATH = os.path.join(DATA_DIR, "parent_masterlist.json")
 METRICS_PARENT_REPS_PATH = os.path.join(DATA_DIR, "metrics_parent_reps.json")
+METRICS_PARENT_PARQUET_PATH = os.path.join(DATA_DIR, "metrics_parent_reps.parquet")
 METRICS_BY_CODE_PATH = os.path.join(DATA_DIR, "metrics_by_code.json")
 SCHEME_DOCS_DIR = os.path.join(DATA_DIR, "scheme_docs")
 OUTPUT_UI_PATH = os.path.join(DATA_DIR, "metrics_ui.json")
@@ -29,14 +47,58 @@ OUTPUT_UI_PATH = os.path.join(DATA_DIR, "metrics_ui.json")
 # ---------------------------
 # Utilities
 # ---------------------------
+# path -> (mtime, parsed): the masterlist/metrics files are read-mostly and
+# multi-MB, so re-parsing them per call is pure waste. A stat() per call keeps
+# the cache honest when a rebuild rewrites the file.
+_JSON_CACHE: Dict[str, Tuple[float, Any]] = {}
+
+# files at or above this size are parsed straight from an mmap'd view,
+# skipping the read()-into-bytes copy of the whole file
+_MMAP_MIN_BYTES = 1 << 20
+
+
 def _load_json(path: str) -> Optional[Any]:
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except FileNotFoundError:
+        st = os.stat(path)
+    except OSError:
         return None
-    except Exception:
+    mtime = st.st_mtime
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    try:
+        with open(path, "rb") as f:
+            if orjson is not None and st.st_size >= _MMAP_MIN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    mv = memoryview(mm)
+                    try:
+                        try:
+                            parsed = orjson.loads(mv)
+                        except Exception:
+                            # NaN/Infinity etc.: stdlib json needs real bytes
+                            parsed = _parse_json_bytes(bytes(mv))
+                    finally:
+                        mv.release()
+            else:
+                parsed = _parse_json_bytes(f.read())
+    except OSError:
         return None
+    if parsed is None:
+        return None
+    _JSON_CACHE[path] = (mtime, parsed)
+    return parsed
+
+
+def _parse_json_bytes(raw: bytes) -> Optional[Any]:
+    try:
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception:
+        # orjson is strict JSON; our metrics files can carry NaN/Infinity
+        # (stdlib json emits and accepts them), so retry with stdlib
+        try:
+            return json.loads(raw)
+        except Exception:
+            return None
 
 
 def _safe_get(d: Optional[Dict], *keys, default=None):
@@ -50,6 +112,10 @@ def _safe_get(d: Optional[Dict], *keys, default=None):
     return cur if cur is not None else default
 
 
+_NUM_RE = re.compile(r"[-+]?\d+(?:\.\d+)?")
+_WS_RE = re.compile(r"\s+")
+
+
 def _coerce_num(val: Any) -> Optional[float]:
     if val is None:
         return None
@@ -59,7 +125,7 @@ def _coerce_num(val: Any) -> Optional[float]:
     if s == "":
         return None
     s2 = s.replace("%", "").replace(",", "").strip()
-    m = re.search(r"[-+]?\d+(\.\d+)?", s2)
+    m = _NUM_RE.search(s2)
     if m:
         try:
             return float(m.group(0))
@@ -71,13 +137,26 @@ def _coerce_num(val: Any) -> Optional[float]:
 # ---------------------------
 # Readers for source files
 # ---------------------------
+# (mtime, groups-view) memo so the filtered fallback view is not rebuilt
+# on every call when the file has no "parent_groups" wrapper
+_MASTERLIST_VIEW: Optional[Tuple[Optional[float], Dict[str, Any]]] = None
+
+
 def _read_parent_masterlist() -> Dict[str, Any]:
+    global _MASTERLIST_VIEW
     pm = _load_json(PARENT_MASTERLIST_PATH)
+    cached = _JSON_CACHE.get(PARENT_MASTERLIST_PATH)
+    marker = cached[0] if cached is not None else None
+    if _MASTERLIST_VIEW is not None and marker is not None and _MASTERLIST_VIEW[0] == marker:
+        return _MASTERLIST_VIEW[1]
     if not isinstance(pm, dict):
         return {}
     if "parent_groups" in pm and isinstance(pm["parent_groups"], dict):
-        return pm["parent_groups"]
-    return {k: v for k, v in pm.items() if k != "meta"}
+        groups = pm["parent_groups"]
+    else:
+        groups = {k: v for k, v in pm.items() if k != "meta"}
+    _MASTERLIST_VIEW = (marker, groups)
+    return groups
 
 
 def _read_parent_metrics() -> Dict[str, Any]:
@@ -87,21 +166,88 @@ def _read_parent_metrics() -> Dict[str, Any]:
     return m
 
 
-_metrics_by_code_cache: Optional[Dict[str, Any]] = None
+# _norm(metrics key) -> entry, so casing/whitespace drift between the
+# masterlist and metrics files cannot silently drop a parent's metrics;
+# rebuilt when the metrics file mtime changes
+_METRICS_NORM_INDEX: Dict[str, Dict[str, Any]] = {}
+_metrics_norm_mtime: Optional[float] = None
 
 
-def _load_metrics_by_code() -> Dict[str, Any]:
-    global _metrics_by_code_cache
-    if _metrics_by_code_cache is None:
-        _metrics_by_code_cache = _load_json(METRICS_BY_CODE_PATH) or {}
-    return _metrics_by_code_cache
+def _lookup_parent_metrics(parent_key: str) -> Optional[Dict[str, Any]]:
+    global _metrics_norm_mtime
+    metrics_all = _read_parent_metrics()
+    entry = metrics_all.get(parent_key)
+    if entry is not None:
+        return entry
+    cached = _JSON_CACHE.get(METRICS_PARENT_REPS_PATH)
+    marker = cached[0] if cached is not None else None
+    if not _METRICS_NORM_INDEX or marker != _metrics_norm_mtime:
+        _METRICS_NORM_INDEX.clear()
+        for k, v in metrics_all.items():
+            _METRICS_NORM_INDEX.setdefault(_norm(k), v)
+        _metrics_norm_mtime = marker
+    return _METRICS_NORM_INDEX.get(_norm(parent_key))
 
 
-def _load_sid_for_code(code: Optional[str]) -> Optional[Dict[str, Any]]:
-    if not code:
+# parent_key -> flattened metrics row, read once from the parquet sidecar
+# written by build_parent_metrics and invalidated on its mtime
+_METRICS_ROWS: Optional[Dict[str, Dict[str, Any]]] = None
+_metrics_rows_mtime: Optional[float] = None
+
+
+def _get_metrics_rows() -> Optional[Dict[str, Dict[str, Any]]]:
+    global _METRICS_ROWS, _metrics_rows_mtime
+    try:
+        mtime = os.stat(METRICS_PARENT_PARQUET_PATH).st_mtime
+    except OSError:
         return None
-    path = os.path.join(SCHEME_DOCS_DIR, f"{str(code).strip()}.json")
-    return _load_json(path)
+    if _METRICS_ROWS is not None and mtime == _metrics_rows_mtime:
+        return _METRICS_ROWS
+    try:
+        import pandas as pd
+        df = pd.read_parquet(METRICS_PARENT_PARQUET_PATH)
+        rows = {rec["parent_key"]: rec for rec in df.to_dict(orient="records")}
+    except Exception:
+        return None
+    _METRICS_ROWS = rows
+    _metrics_rows_mtime = mtime
+    return rows
+
+
+def get_metrics_row(parent_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Flattened scalar metrics row for a parent (rep_code/rep_name plus the
+    numeric metric columns). Served from the parquet sidecar when present,
+    falling back to the JSON metrics file.
+    """
+    if not parent_key:
+        return None
+    rows = _get_metrics_rows()
+    if rows is not None:
+        row = rows.get(parent_key)
+        if row is not None:
+            return dict(row)
+
+    entry = _lookup_parent_metrics(parent_key)
+    if not isinstance(entry, dict):
+        return None
+    m = entry.get("metrics") if isinstance(entry.get("metrics"), dict) else {}
+    row = {
+        "parent_key": parent_key,
+        "rep_code": entry.get("rep_code"),
+        "rep_name": entry.get("rep_name"),
+        "rep_reason": entry.get("rep_reason"),
+        "rep_reason_score": entry.get("rep_reason_score"),
+    }
+    for k, v in m.items():
+        if not isinstance(v, (dict, list)):
+            row[k] = v
+    return row
+
+
+def _load_metrics_by_code() -> Dict[str, Any]:
+    # _load_json caches by mtime, so no separate module cache is needed here
+    return _load_json(METRICS_BY_CODE_PATH) or {}
 
 
 # ---------------------------
@@ -377,7 +523,7 @@ def generate_ui_payload() -> Dict[str, Any]:
                 rep_code = str(first) if first else rep_code
 
         # Load parent's SID (from representative code) and extract robust SID-derived fields
-        rep_sid = _load_sid_for_code(rep_code) if rep_code else None
+        rep_sid = _load_sid_doc(rep_code) if rep_code else None
         sid_fields = _extract_parent_sid_fields(rep_sid)
 
         # parent-level metrics entry used as fallback
@@ -427,5 +573,394 @@ def dump_ui_file() -> str:
     return OUTPUT_UI_PATH
 
 
+# ---------------------------
+# Parent overview query API
+# ---------------------------
+def _norm(s: Optional[str]) -> str:
+    if not s:
+        return ""
+    t = str(s).strip().lower()
+    # fast path: most keys are ASCII with no whitespace runs to collapse,
+    # so skip the regex engine unless one could be present
+    if t.isascii() and not ("  " in t or "\t" in t or "\n" in t
+                            or "\r" in t or "\x0b" in t or "\x0c" in t):
+        return t
+    return _WS_RE.sub(" ", t)
+
+
+def _load_raw_parent_masterlist() -> Optional[Dict[str, Any]]:
+    return _load_json(PARENT_MASTERLIST_PATH)
+
+
+# normalized parent key -> original key, rebuilt only when the masterlist
+# file changes; turns per-query _norm() loops over all parents into one
+# dict lookup
+_NORM_INDEX: Dict[str, str] = {}
+_NORM_LIST: List[str] = []
+_norm_index_mtime: Optional[float] = None
+
+
+def _get_norm_index(parent_groups: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, str], List[str]]:
+    global _norm_index_mtime
+    if parent_groups is None:
+        parent_groups = _read_parent_masterlist()
+    cached = _JSON_CACHE.get(PARENT_MASTERLIST_PATH)
+    marker = cached[0] if cached is not None else None
+    if _NORM_INDEX and marker is not None and marker == _norm_index_mtime:
+        return _NORM_INDEX, _NORM_LIST
+    _NORM_INDEX.clear()
+    for k in parent_groups:
+        _NORM_INDEX.setdefault(_norm(k), k)
+    _NORM_LIST[:] = list(_NORM_INDEX.keys())
+    _norm_index_mtime = marker
+    return _NORM_INDEX, _NORM_LIST
+
+
+# streamed key list memoized against the masterlist mtime, same pattern as
+# _MASTERLIST_VIEW / _NORM_INDEX, so repeat get_parent_keys() calls do not
+# re-stream the multi-MB file
+_PARENT_KEYS: Optional[List[str]] = None
+_parent_keys_mtime: Optional[float] = None
+
+
+def _load_parent_keys_only() -> List[str]:
+    """
+    Parent keys without materializing the children arrays: when ijson is
+    available and the full file is not already cached, stream just the
+    map keys under 'parent_groups' (once per file mtime). Otherwise fall
+    back to the cached full parse.
+    """
+    global _PARENT_KEYS, _parent_keys_mtime
+    if ijson is not None and _JSON_CACHE.get(PARENT_MASTERLIST_PATH) is None:
+        try:
+            mtime = os.stat(PARENT_MASTERLIST_PATH).st_mtime
+        except OSError:
+            mtime = None
+        if mtime is not None:
+            if _PARENT_KEYS is not None and mtime == _parent_keys_mtime:
+                return _PARENT_KEYS
+            try:
+                with open(PARENT_MASTERLIST_PATH, "rb") as f:
+                    keys = [value for prefix, event, value in ijson.parse(f)
+                            if prefix == "parent_groups" and event == "map_key"]
+                if keys:
+                    _PARENT_KEYS = keys
+                    _parent_keys_mtime = mtime
+                    return keys
+            except Exception:
+                pass
+    return list(_read_parent_masterlist().keys())
+
+
+def get_parent_keys() -> List[str]:
+    """Return all parent keys from the parent masterlist."""
+    return _load_parent_keys_only()
+
+
+def search_parent_keys(query: str, limit: int = 10,
+                       parent_groups: Optional[Dict[str, Any]] = None) -> List[str]:
+    """
+    Find parent keys matching `query`: exact normalized match first, then
+    substring matches, then RapidFuzz fuzzy matches. Callers that already
+    hold the parent groups can pass them to skip a re-load.
+    """
+    norm_index, norm_list = _get_norm_index(parent_groups)
+    if not norm_index:
+        return []
+    if not query:
+        return list(norm_index.values())[:limit]
+
+    qn = _norm(query)
+
+    exact = norm_index.get(qn)
+    if exact is not None:
+        return [exact]
+
+    subs = [orig for n, orig in norm_index.items() if qn in n]
+    if subs:
+        return subs[:limit]
+
+    results = process.extract(qn, norm_list, scorer=fuzz.WRatio, limit=limit, score_cutoff=60)
+    return [norm_index[choice] for choice, _score, _idx in results]
+
+
+@functools.lru_cache(maxsize=2048)
+def _sid_doc_cached(path: str, mtime: float) -> Optional[Dict[str, Any]]:
+    # mtime is part of the cache key: a re-extracted SID doc misses and is
+    # re-read, while the stale entry ages out of the LRU
+    try:
+        with open(path, "rb") as f:
+            return _parse_json_bytes(f.read())
+    except OSError:
+        return None
+
+
+def _load_sid_doc(code: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Load the extracted SID JSON for a scheme code, or None if absent."""
+    if not code:
+        return None
+    path = os.path.join(SCHEME_DOCS_DIR, f"{str(code).strip()}.json")
+    try:
+        mtime = os.stat(path).st_mtime
+    except OSError:
+        return None
+    return _sid_doc_cached(path, mtime)
+
+
+# shared pool for SID-doc fallback loads: the per-child stat+read is
+# I/O-bound, so scanning a large parent's children concurrently beats a
+# sequential loop
+_SID_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="sid-load")
+
+
+def _first_sid_doc(codes: List[str]) -> Optional[Dict[str, Any]]:
+    """Load SID docs for codes concurrently, return the first hit (by order)."""
+    if not codes:
+        return None
+    if len(codes) == 1:
+        return _load_sid_doc(codes[0])
+    for sid in _SID_EXECUTOR.map(_load_sid_doc, codes):
+        if sid is not None:
+            return sid
+    return None
+
+
+# alternative key spellings probed by _pick_preferred_value, built once at
+# import time; tuples iterate faster than per-call list literals
+_ALT_KEYS: Dict[str, Tuple[str, ...]] = {k: tuple(v) for k, v in {
+    "declared_benchmark": ["declared_benchmark", "benchmark", "benchmarks"],
+    "fund_manager": ["fund_manager", "fund_managers", "fund_manager_name"],
+    "expense_ratio_percent": ["expense_ratio_percent", "expense_ratio", "ter"],
+    "category": ["category", "scheme_category", "scheme_type_category"],
+    "scheme_type": ["scheme_type", "type_of_scheme"],
+    "plans_and_options": ["plans_and_options", "plans_options", "plans"],
+    "asset_allocation_summary": ["asset_allocation_summary", "asset_allocation", "asset_allocation_pattern"],
+    "fund_objective_summary": ["fund_objective_summary", "objective_summary", "investment_objective"],
+    "exit_load": ["exit_load", "load_structure", "exit_load_percent"],
+}.items()}
+
+
+def _metrics_candidates(metrics_raw: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Resolve a metrics entry to its probe-able dict (nested 'metrics' preferred)."""
+    if isinstance(metrics_raw, dict):
+        if "metrics" in metrics_raw and isinstance(metrics_raw["metrics"], dict):
+            return metrics_raw["metrics"]
+        return metrics_raw
+    return {}
+
+
+def _pick_preferred_value(cand_metrics: Dict[str, Any],
+                          sid: Optional[Dict[str, Any]],
+                          summary: Optional[Dict[str, Any]],
+                          *keys: str) -> Optional[Any]:
+    """
+    For each key, probe the metrics dict (as resolved by _metrics_candidates),
+    then the SID doc, then its summary block; alternative key spellings are
+    also tried. Returns the first non-empty value found.
+    """
+    _empty = (None, "", [], {})
+
+    # bind .get once per source; the isinstance checks do not belong in the
+    # per-key loop
+    getters = [s.get for s in (cand_metrics, sid, summary) if isinstance(s, dict)]
+
+    for key in keys:
+        names = _ALT_KEYS.get(key) or (key,)
+        for name in names:
+            for get in getters:
+                v = get(name)
+                if v not in _empty:
+                    return v
+    return None
+
+
+def merge_sid_summary_into_metrics(metrics_raw: Optional[Dict[str, Any]],
+                                   sid: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge metrics entry + SID doc into one flat dict of normalized fields
+    (text fields as-is, numeric fields coerced to float).
+    """
+    summary = None
+    if isinstance(sid, dict) and isinstance(sid.get("summary"), dict):
+        summary = sid["summary"]
+
+    # resolved once here instead of once per probed field
+    cand_metrics = _metrics_candidates(metrics_raw)
+
+    merged: Dict[str, Any] = {}
+    for field in ("category", "scheme_type", "declared_benchmark", "fund_objective_summary",
+                  "plans_and_options", "asset_allocation_summary", "fund_manager", "exit_load"):
+        merged[field] = _pick_preferred_value(cand_metrics, sid, summary, field)
+
+    for field in ("expense_ratio_percent", "cagr", "rolling_1y", "rolling_3y", "rolling_5y",
+                  "volatility_annual", "sharpe", "sortino", "max_drawdown", "aum",
+                  "beta", "tracking_error"):
+        merged[field] = _coerce_num(_pick_preferred_value(cand_metrics, sid, summary, field))
+
+    for field in ("data_points", "first_date", "last_date"):
+        merged[field] = _pick_preferred_value(cand_metrics, sid, summary, field)
+
+    return merged
+
+
+@dataclass(slots=True, frozen=True)
+class _ParentChildren:
+    """Cached per-parent children as parallel columns (no per-child dicts)."""
+    codes: Tuple[str, ...]
+    names: Tuple[str, ...]
+
+    def to_list_of_dicts(self) -> List[Dict[str, str]]:
+        return [{"scheme_code": c, "scheme_name": n} for c, n in zip(self.codes, self.names)]
+
+
+# parent_key -> _ParentChildren; one frozen slots object per parent instead
+# of a throwaway dict per child on every request. Dicts are materialized
+# only in the returned payload.
+_CHILDREN_CACHE: Dict[str, _ParentChildren] = {}
+_children_cache_mtime: Optional[float] = None
+
+
+def _get_children_columns(parent_key: str,
+                          parent_groups: Dict[str, Any]) -> _ParentChildren:
+    global _children_cache_mtime
+    cached = _JSON_CACHE.get(PARENT_MASTERLIST_PATH)
+    marker = cached[0] if cached is not None else None
+    if marker != _children_cache_mtime:
+        _CHILDREN_CACHE.clear()
+        _children_cache_mtime = marker
+
+    cols = _CHILDREN_CACHE.get(parent_key)
+    if cols is not None:
+        return cols
+
+    codes: List[str] = []
+    names: List[str] = []
+    # intern the codes: the same short strings recur as rep_codes, metrics
+    # keys and equality probes, so interning dedups them and makes those
+    # comparisons pointer checks
+    for entry in parent_groups.get(parent_key) or []:
+        if isinstance(entry, (list, tuple)) and len(entry) >= 2:
+            codes.append(sys.intern(str(entry[0])))
+            names.append(entry[1])
+        elif isinstance(entry, dict):
+            code = str(entry.get("scheme_code") or entry.get("code") or "").strip()
+            if code:
+                codes.append(sys.intern(code))
+                names.append(entry.get("scheme_name") or entry.get("name") or "")
+    cols = _ParentChildren(codes=tuple(codes), names=tuple(names))
+    _CHILDREN_CACHE[parent_key] = cols
+    return cols
+
+
+def _rep_info_from_metrics(metrics_entry: Optional[Dict[str, Any]],
+                           codes: Tuple[str, ...],
+                           names: Tuple[str, ...]) -> Tuple[Optional[str], Optional[str]]:
+    rep_code = None
+    rep_name = None
+    if isinstance(metrics_entry, dict):
+        rep_code = sys.intern(str(metrics_entry.get("rep_code"))) if metrics_entry.get("rep_code") else None
+        rep_name = metrics_entry.get("rep_name") or None
+    if not rep_code and codes:
+        rep_code = codes[0]
+        rep_name = rep_name or names[0]
+    if rep_code and not rep_name:
+        try:
+            rep_name = names[codes.index(rep_code)]
+        except ValueError:
+            rep_name = None
+    return rep_code, rep_name
+
+
+def get_parent_overview(parent_key: str) -> Optional[Dict[str, Any]]:
+    """
+    Full overview for one parent product:
+      parent_key, summary, representative_child, children, metrics (raw entry),
+      metrics_numeric (merged/coerced), sid (extracted SID doc or {}).
+    `parent_key` may be an exact key or anything search_parent_keys can resolve.
+    """
+    if not parent_key:
+        return None
+    parent_groups = _read_parent_masterlist()
+    if not parent_groups:
+        return None
+
+    norm_index, _ = _get_norm_index(parent_groups)
+    chosen_key = norm_index.get(_norm(parent_key))
+    if chosen_key is None:
+        matches = search_parent_keys(parent_key, limit=1, parent_groups=parent_groups)
+        if not matches:
+            return None
+        chosen_key = matches[0]
+
+    children_cols = _get_children_columns(chosen_key, parent_groups)
+    codes, names = children_cols.codes, children_cols.names
+
+    metrics_entry = _lookup_parent_metrics(chosen_key)
+
+    rep_code, rep_name = _rep_info_from_metrics(metrics_entry, codes, names)
+
+    sid = _load_sid_doc(rep_code)
+    if sid is None:
+        sid = _first_sid_doc(list(codes))
+
+    metrics_numeric = merge_sid_summary_into_metrics(metrics_entry, sid)
+    # fixed-shape dict literals compile to single BUILD_MAP ops with constant
+    # keys — the pre-sized construction the hot return path wants; only the
+    # repeated .get attribute lookup is worth binding out
+    mg = metrics_numeric.get
+    summary = {
+        "category": mg("category"),
+        "scheme_type": mg("scheme_type"),
+        "declared_benchmark": mg("declared_benchmark"),
+        "fund_manager": mg("fund_manager"),
+        "expense_ratio_percent": mg("expense_ratio_percent"),
+        "exit_load": mg("exit_load"),
+        "fund_objective_summary": mg("fund_objective_summary"),
+    }
+
+    return {
+        "parent_key": chosen_key,
+        "summary": summary,
+        "representative_child": {"rep_code": rep_code, "rep_name": rep_name},
+        "children": children_cols.to_list_of_dicts(),
+        "metrics": metrics_entry or {},
+        "metrics_numeric": metrics_numeric,
+        "sid": sid or {},
+    }
+
+
+def get_parent_overviews(parent_keys: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """
+    Batch variant of get_parent_overview for dashboard-style pages that
+    render several parents at once. Representative SID docs for all
+    requested parents are prefetched concurrently on the shared pool so
+    the per-parent file I/O overlaps; each overview is then assembled from
+    the warm caches. Returns {requested_key: overview_or_None}.
+    """
+    keys = [k for k in parent_keys if k]
+    if not keys:
+        return {}
+
+    parent_groups = _read_parent_masterlist()
+    norm_index, _ = _get_norm_index(parent_groups)
+
+    rep_codes: List[str] = []
+    for k in keys:
+        chosen_key = norm_index.get(_norm(k))
+        if chosen_key is None:
+            continue
+        cols = _get_children_columns(chosen_key, parent_groups)
+        metrics_entry = _lookup_parent_metrics(chosen_key)
+        rep_code, _rep_name = _rep_info_from_metrics(metrics_entry, cols.codes, cols.names)
+        if rep_code:
+            rep_codes.append(rep_code)
+
+    if rep_codes:
+        # warm the mtime-keyed SID LRU in parallel; results are discarded here
+        list(_SID_EXECUTOR.map(_load_sid_doc, rep_codes))
+
+    return {k: get_parent_overview(k) for k in keys}
+
+
 if __name__ == "__main__":
     dump_ui_file()